@@ -93,7 +93,7 @@ class BaseElement(six.with_metaclass(ABCMeta)):
         """Set all models on this element
         """
         # print(models)
-        log.debug("Setting models on %s" % self)
+        log.debug("Setting models on %s", self)
         self._streamlined_models_list = None
         self.models.extend(models)
         self.models = self.models
@@ -57,17 +57,15 @@ class Figure(CaptionedElement):
                     continue
 
                 for record in parser_records:
-                    p = record.serialize()
-                    if not p:  # TODO: Potential performance issues?
-                        continue
                     # Skip duplicate records
                     if record in records:
                         continue
-                    # Skip just labels that have already been seen (bit of a hack)
-                    if (isinstance(record, Compound) and 'Compound' in p.keys() and all(k in {'labels', 'roles'} for k in p['Compound'].keys()) and
-                        set(record.labels).issubset(seen_labels)):
-                        continue
                     if isinstance(record, Compound):
+                        # Skip just labels that have already been seen (bit of a hack). Only Compound records are serialized for this check
+                        p = record.serialize()
+                        if ('Compound' in p.keys() and all(k in {'labels', 'roles'} for k in p['Compound'].keys()) and
+                          set(record.labels).issubset(seen_labels)):
+                            continue
                         seen_labels.update(record.labels)
                         # This could be super slow if we find lots of things
                         found = False
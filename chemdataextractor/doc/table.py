@@ -61,6 +61,7 @@ class Table(CaptionedElement):
         """
         super(Table, self).__init__(caption=caption, label=label, models=models, **kwargs)
         self.footnotes = footnotes if footnotes is not None else []
+        self._cde_tables_cache = {}
         try:
             #: TableDataExtractor `Table` object. Can pass any kwargs into TDE directly.
             self.tde_table = TdeTable(table_data, **kwargs)
@@ -114,20 +115,21 @@ class Table(CaptionedElement):
                 log.debug(parser)
                 results = parser.parse_cell(cde_cell)
                 for result in results:
-                    if result.serialize() != {}:
-
-                        # Add information from previous category table
-                        result = self._add_category_table_records(result, table_records, cde_cell)
-                        result.table_row_categories = ' '.join(cde_cell.row_categories)
-                        result.table_col_categories = ' '.join(cde_cell.col_categories)
-                        yield result
+                    # Add information from previous category table
+                    result = self._add_category_table_records(result, table_records, cde_cell)
+                    result.table_row_categories = ' '.join(cde_cell.row_categories)
+                    result.table_col_categories = ' '.join(cde_cell.col_categories)
+                    yield result
 
     def _add_category_table_records(self, result, table_records, cde_cell):
+        # The model type fields of the result only depend on its class, so only look them up once
+        types = None
         for record in table_records:
             if hasattr(record, 'raw_value'):
                 if record.raw_value in cde_cell.row_categories and record.table_row_categories in cde_cell.row_categories:
-                    types = [(key, item.model_class) for (key, item) in result.fields.items() if
-                             item.__class__.__name__ == 'ModelType']
+                    if types is None:
+                        types = [(key, item.model_class) for (key, item) in result.fields.items() if
+                                 item.__class__.__name__ == 'ModelType']
                     for key, value in types:
                         if value == type(record) and getattr(result, key) is None:
                             setattr(result, key, record)
@@ -165,17 +167,8 @@ class Table(CaptionedElement):
         if not caption_records:
             caption_records = ModelList()
 
-        # Create a representation of the table that is more amenable to parsing
-        cde_tables = []
-        for category_table in self._category_tables(table):
-            cde_table = []
-            for cell in category_table:
-                cde_cell = Cell.from_tdecell(cell, models=self.models)
-                cde_table.append(cde_cell)
-            cde_tables.append(cde_table)
-
-        # Invert the table order
-        cde_tables = cde_tables[::-1]
+        # Create a representation of the table that is more amenable to parsing, in inverted table order
+        cde_tables = self._cde_tables(table)[::-1]
 
         # Step 1
         table_records = ModelList()
@@ -204,6 +197,31 @@ class Table(CaptionedElement):
 
         return table_records
 
+    def _cde_tables(self, table):
+        """
+        Get a representation of the table that is more amenable to parsing, as a list of category tables,
+        each of which is a list of :class:`~chemdataextractor.doc.text.Cell` objects.
+        Tokenising and tagging the cells is expensive, so the cells are cached per TDE table and
+        only recreated if the models for this table change, as these affect the tokenisation.
+
+        :param table: Input TableDataExtractor object
+        :type table: TableDataExtractor.Table
+        :return: list of category tables (lists of Cell objects)
+        """
+        models = tuple(self.models)
+        cached = self._cde_tables_cache.get(id(table))
+        if cached is not None and cached[0] == models:
+            return cached[1]
+        cde_tables = []
+        for category_table in self._category_tables(table):
+            cde_table = []
+            for cell in category_table:
+                cde_cell = Cell.from_tdecell(cell, models=self.models)
+                cde_table.append(cde_cell)
+            cde_tables.append(cde_table)
+        self._cde_tables_cache[id(table)] = (models, cde_tables)
+        return cde_tables
+
     def _category_tables(self, table):
         """
         Yields the category table and row category tables for a given TableDataExtractor table.
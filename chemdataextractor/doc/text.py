@@ -222,6 +222,9 @@ class Text(collections.Sequence, BaseText):
     @memoized_property
     def sentences(self):
         """A list of :class:`Sentence` s that make up this text passage."""
+        # Empty passages, such as the blank captions of tables read from CSV, have no sentences
+        if not self.text:
+            return []
         return self.sentence_tokenizer.get_sentences(self)
 
     def _sentences_from_spans(self, spans):
@@ -544,9 +547,10 @@ class Sentence(BaseText):
         if self.abbreviation_detector:
             # log.debug('Detecting abbreviations')
             ners = self.unprocessed_ner_tags
-            for abbr_span, long_span in self.abbreviation_detector.detect_spans(self.raw_tokens):
-                abbr = self.raw_tokens[abbr_span[0]:abbr_span[1]]
-                long = self.raw_tokens[long_span[0]:long_span[1]]
+            raw_tokens = self.raw_tokens
+            for abbr_span, long_span in self.abbreviation_detector.detect_spans(raw_tokens):
+                abbr = raw_tokens[abbr_span[0]:abbr_span[1]]
+                long = raw_tokens[long_span[0]:long_span[1]]
                 # Check if long is entirely tagged as one named entity type
                 long_tags = ners[long_span[0]:long_span[1]]
                 unique_tags = set([tag[2:] for tag in long_tags if tag is not None])
@@ -572,18 +576,20 @@ class Sentence(BaseText):
         # log.debug('Getting ner_tags')
         ner_tags = self.unprocessed_ner_tags
         abbrev_defs = self.document.abbreviation_definitions if self.document else self.abbreviation_definitions
+        # raw_tokens builds a new list on each access, so only build it once here
+        raw_tokens = self.raw_tokens
         # Ensure abbreviation entity matches long entity
         # TODO: This is potentially a performance bottleneck?
         for i in range(0, len(ner_tags)):
             for abbr, long, ner_tag in abbrev_defs:
-                if abbr == self.raw_tokens[i:i+len(abbr)]:
+                if abbr == raw_tokens[i:i+len(abbr)]:
                     old_ner_tags = ner_tags[i:i+len(abbr)]
                     ner_tags[i] = 'B-%s' % ner_tag if ner_tag is not None else None
                     ner_tags[i+1:i+len(abbr)] = ['I-%s' % ner_tag if ner_tag is not None else None] * (len(abbr) - 1)
                     # Remove ner tags from brackets surrounding abbreviation
-                    if i > 1 and self.raw_tokens[i-1] == '(':
+                    if i > 1 and raw_tokens[i-1] == '(':
                         ner_tags[i-1] = None
-                    if i < len(self.raw_tokens) - 1 and self.raw_tokens[i+1] == ')':
+                    if i < len(raw_tokens) - 1 and raw_tokens[i+1] == ')':
                         ner_tags[i+1] = None
                     if not old_ner_tags == ner_tags[i:i+len(abbr)]:
                         log.debug('Correcting abbreviation tag: %s (%s): %s -> %s' % (' '.join(abbr), ' '.join(long), old_ner_tags, ner_tags[i:i+len(abbr)]))
@@ -737,7 +743,7 @@ class Sentence(BaseText):
                 tags[i] = tag
         return tags
 
-    @property
+    @memoized_property
     def tagged_tokens(self):
         """
         A list of (:class:`Token` token, :class:`str` named entity recognition tag)
@@ -760,17 +766,15 @@ class Sentence(BaseText):
             for parser in model.parsers:
                 if hasattr(parser, 'parse_sentence'):
                     for record in parser.parse_sentence(tagged_tokens):
-                        p = record.serialize()
-                        if not p:  # TODO: Potential performance issues?
-                            continue
                         # Skip duplicate records
                         if record in records:
                             continue
-                        # Skip just labels that have already been seen (bit of a hack)
-                        if (isinstance(record, Compound) and 'Compound' in p.keys() and all(k in {'labels', 'roles'} for k in p['Compound'].keys()) and
-                          set(record.labels).issubset(seen_labels)):
-                            continue
                         if isinstance(record, Compound):
+                            # Skip just labels that have already been seen (bit of a hack). Only Compound records are serialized for this check
+                            p = record.serialize()
+                            if ('Compound' in p.keys() and all(k in {'labels', 'roles'} for k in p['Compound'].keys()) and
+                              set(record.labels).issubset(seen_labels)):
+                                continue
                             seen_labels.update(record.labels)
                             # This could be super slow if we find lots of things
                             found = False
@@ -206,10 +206,11 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         self._values = {}
         for key, value in six.iteritems(raw_data):
             setattr(self, key, value)
-        # Set defaults
+        # Set defaults, only copying those that could be mutable (most fields default to None)
         for key, field in six.iteritems(self.fields):
             if key not in raw_data:
-                setattr(self, key, copy.copy(field.default))
+                default = field.default
+                setattr(self, key, copy.copy(default) if default is not None else None)
         self._record_method = None
         self.was_updated = self._updated
 
@@ -235,7 +236,7 @@ class BaseModel(six.with_metaclass(ModelMeta)):
     def __eq__(self, other):
         # TODO: Check this actually works as expected (what about default values?)
         if isinstance(other, self.__class__):
-            log.debug(self._values, other._values)
+            log.debug('Comparing %s and %s', self._values, other._values)
             return self._values == other._values
         return False
 
@@ -402,13 +403,12 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         """Convert Model to python dictionary."""
         # Serialize fields to a dict
         data = {}
-        for field_name in self:
+        for field_name, field in six.iteritems(self.fields):
             value = getattr(self, field_name)
-            field = self.fields.get(field_name)
             if value is not None:
                 value = field.serialize(value, primitive=primitive)
             # Skip empty fields unless field.null
-            if not field.null and value in [None, '', []]:
+            if not field.null and (value is None or value == '' or value == []):
                 continue
             data[field.name] = value
         record = {self.__class__.__name__: data}
@@ -439,18 +439,23 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         """
         if type(self) != type(other):
             return False
+        # Read the stored values directly rather than through __getitem__ and the field descriptors
+        values = self._values
+        other_values = other._values
         for field_name, field in six.iteritems(self.fields):
+            value = values.get(field_name)
+            other_value = other_values.get(field_name)
             # Method works recursively so it works with nested models
             if hasattr(field, 'model_class'):
-                if self[field_name] is None:
-                    if other[field_name] is not None:
+                if value is None:
+                    if other_value is not None:
                         return False
-                elif other[field_name] is None:
+                elif other_value is None:
                     pass
-                elif not self[field_name].is_superset(other[field_name]):
+                elif not value.is_superset(other_value):
                     return False
             else:
-                if other[field_name] is not None and self[field_name] != other[field_name]:
+                if other_value is not None and value != other_value:
                     return False
         return True
 
@@ -40,12 +40,16 @@ class Compound(BaseModel):
 
     def merge(self, other):
         """Merge data from another Compound into this Compound."""
-        log.debug('Merging: %s and %s' % (self.serialize(), other.serialize()))
+        # Serializing is expensive, so only do it when the debug output will actually be emitted
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug('Merging: %s and %s', self.serialize(), other.serialize())
         for k in self.keys():
             for new_item in other[k]:
                 if new_item not in self[k]:
                     self[k].append(new_item)
-        log.debug('Result: %s' % self.serialize())
+        if debug:
+            log.debug('Result: %s', self.serialize())
         return self
 
     @property
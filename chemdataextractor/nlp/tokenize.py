@@ -67,9 +67,11 @@ class BaseTokenizer(six.with_metaclass(ABCMeta)):
 
 
 def regex_span_tokenize(s, regex):
-    """Return spans that identify tokens in s split using regex."""
+    """Return spans that identify tokens in s split using regex, given as a pattern string or a compiled pattern."""
+    if isinstance(regex, six.string_types):
+        regex = re.compile(regex, re.U)
     left = 0
-    for m in re.finditer(regex, s, re.U):
+    for m in regex.finditer(s):
         right, next = m.span()
         if right != 0:
             yield left, right
@@ -242,6 +244,8 @@ class WordTokenizer(BaseTokenizer):
     }
     #: Don't split around hyphens if only these characters before or after.
     NO_SPLIT_CHARS = '0123456789,\'"“”„‟‘’‚‛`´′″‴‵‶‷⁗'
+    #: Regular expression that matches the whitespace used for the initial split into spans
+    WHITESPACE_RE = re.compile(r'\s+', re.U)
 
     def __init__(self, split_last_stop=True):
         #: Whether to split off the final full stop (unless preceded by NO_SPLIT_STOP). Default True.
@@ -347,7 +351,7 @@ class WordTokenizer(BaseTokenizer):
         """"""
         # First get spans by splitting on all whitespace
         # Includes: \u0020 \u00A0 \u1680 \u180E \u2000 \u2001 \u2002 \u2003 \u2004 \u2005 \u2006 \u2007 \u2008 \u2009 \u200A \u202F \u205F \u3000
-        spans = [(left, right) for left, right in regex_span_tokenize(s, '\s+') if not left == right]
+        spans = [(left, right) for left, right in regex_span_tokenize(s, self.WHITESPACE_RE) if not left == right]
         i = 0
         # Recursively split spans according to rules
         while i < len(spans):
@@ -473,8 +477,12 @@ class ChemWordTokenizer(WordTokenizer):
     SPLIT_END_NO_DIGIT = ['(aq)', '(aq.)', '(s)', '(l)', '(g)']
     #: Don't split around slash when both preceded and followed by these characters
     NO_SPLIT_SLASH = ['+', '-', '−']
+    #: Characters that may be split around, subject to the exceptions in :meth:`_subspan`
+    SPLIT_CHARS = frozenset([':', ';', 'x', '+', '−', '±', '/', '>', '→', '(', '-'])
     #: Regular expression that matches a numeric quantity with units
     QUANTITY_RE = re.compile(r'^((?P<split>\d\d\d)g|(?P<_split1>[-−]?\d+\.\d+|10[-−]\d+)(g|s|m|N|V)([-−]?[1-4])?|(?P<_split2>\d*[-−]?\d+\.?\d*)([pnµμm]A|[µμmk]g|[kM]J|m[lL]|[nµμm]?M|[nµμmc]m|kN|[mk]V|[mkMG]?W|[mnpμµ]s|Hz|[Mm][Oo][Ll](e|ar)?s?|k?Pa|ppm|min)([-−]?[1-4])?)$')
+    #: Regular expression that matches a number followed by a bracketed word, e.g. IR peaks with bracketed strength/shape
+    BRACKETED_PEAK_RE = re.compile(r'^(\d+\.\d+|\d{3,})(\([a-z]+\))$', re.I)
     #: Don't split on hyphen if the prefix matches this regular expression
     NO_SPLIT_PREFIX_ENDING = re.compile('(^\(.*\)|^[\d,\'"“”„‟‘’‚‛`´′″‴‵‶‷⁗Α-Ωα-ω]+|ano|ato|azo|boc|bromo|cbz|chloro|eno|fluoro|fmoc|ido|ino|io|iodo|mercapto|nitro|ono|oso|oxalo|oxo|oxy|phospho|telluro|tms|yl|ylen|ylene|yliden|ylidene|ylidyn|ylidyne)$', re.U)
     #: Don't split on hyphen if prefix or suffix match this regular expression
@@ -677,7 +685,7 @@ class ChemWordTokenizer(WordTokenizer):
             return self._split_span(span, 2, 1)
 
         # Split things like \d+\.\d+([a-z]+) e.g. UV-vis/IR peaks with bracketed strength/shape
-        m = re.match('^(\d+\.\d+|\d{3,})(\([a-z]+\))$', text, re.I)
+        m = self.BRACKETED_PEAK_RE.match(text)
         if m:
             return self._split_span(span, m.start(2), 1)
 
@@ -695,6 +703,9 @@ class ChemWordTokenizer(WordTokenizer):
 
         # Characters to split around, but with exceptions
         for i, char in enumerate(text):
+            # Most characters are never split around, so skip them before slicing the text around them
+            if char not in self.SPLIT_CHARS:
+                continue
             before = text[:i]
             after = text[i+1:]
             if char in {':', ';'}:
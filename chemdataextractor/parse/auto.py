@@ -20,6 +20,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+from collections import OrderedDict
 import logging
 import six
 import re
@@ -35,7 +36,13 @@ import xml.etree.ElementTree as etree
 
 log = logging.getLogger(__name__)
 
-disallowed_perovskites = ['PbI2', 'SnO2']
+disallowed_perovskites = frozenset(['PbI2', 'SnO2'])
+
+# How many units strings each match_dimensions_of condition remembers the outcome for
+_MAX_DIMENSION_MATCHES = 512
+
+# A regex pattern to check that a perovskite raw value ends with a halogen anion or a stoichiometry, e.g. MAPbI3 or CsPbI2Br
+_perovskite_ending_pattern = re.compile(r'((I)|(Cl)|(Br)|(F)|(At)|(Ts)|(\d+\.?\d*)|(x$)|(y$))+')  # IF(Cl)(Br)(At)
 
 
 def construct_unit_element(dimensions):
@@ -98,13 +105,26 @@ def match_dimensions_of(model):
     :returns: A function which will return True if the results of parsing match the model's dimensions, False if not.
     :rtype: function(tuple(list(Element), int) -> bool)
     """
+    # Whether a units string matches only depends on the string, so remember the outcome for the most recently
+    # seen strings instead of extracting the units again whenever the same string is found. The parser root, and
+    # this closure with it, can live for a whole extraction run, so the number of remembered strings is bounded.
+    matches = OrderedDict()
+
     def check_match(result):
-        try:
-            extract_units(result[0].text, model.dimensions, strict=True)
-            return True
-        except TypeError as e:
-            log.debug(e)
-            return False
+        text = result[0].text
+        if text in matches:
+            matched = matches.pop(text)
+        else:
+            try:
+                extract_units(text, model.dimensions, strict=True)
+                matched = True
+            except TypeError as e:
+                log.debug(e)
+                matched = False
+            if len(matches) >= _MAX_DIMENSION_MATCHES:
+                matches.popitem(last=False)
+        matches[text] = matched
+        return matched
     return check_match
 
 
@@ -127,11 +147,34 @@ class BaseAutoParser(BaseParser):
     model = None
     _specifier = None
     _root_phrase = None
+    _root_cache = None
 
     def __init__(self):
         super(BaseAutoParser, self).__init__()
         self._trigger_property = None
 
+    def _root_key(self):
+        """
+        Everything the root phrase is built from: the model, the parser options and the
+        parse expressions of the model's fields and of the fields of any nested models.
+        Updating or resetting a field replaces its parse expression, which changes the key.
+        """
+        expressions = []
+        for field in six.itervalues(self.model.fields):
+            expressions.append(field.parse_expression)
+            if hasattr(field, 'model_class'):
+                expressions.extend(subfield.parse_expression for subfield in six.itervalues(field.model_class.fields))
+        return self.model, getattr(self, 'lenient', None), getattr(self, 'chem_name', None), tuple(expressions)
+
+    def _cached_root(self, build_root):
+        """
+        Return the root phrase made by build_root, building it again only when :meth:`_root_key` has changed.
+        """
+        key = self._root_key()
+        if self._root_cache is None or self._root_cache[0] != key:
+            self._root_cache = (key, build_root())
+        return self._root_cache[1]
+
     def interpret(self, result, start, end):
         # print(etree.tostring(result))
         if result is None:
@@ -210,7 +253,7 @@ class BaseAutoParser(BaseParser):
                 if data is not None:
                     field_data.update(data)
             field_object = field.model_class(**field_data)
-            log.debug('Created for' + field_name)
+            log.debug('Created for %s', field_name)
             log.debug(field_object)
             return {field_name: field_object}
         elif hasattr(field, 'field'):
@@ -262,6 +305,9 @@ class AutoSentenceParser(BaseAutoParser, BaseSentenceParser):
 
     @property
     def root(self):
+        return self._cached_root(self._build_root)
+
+    def _build_root(self):
         # is always found, our models currently rely on the compound
         chem_name = self.chem_name
         compound_model = self.model.compound.model_class
@@ -319,6 +365,9 @@ class AutoTableParser(BaseAutoParser, BaseTableParser):
 
     @property
     def root(self):
+        return self._cached_root(self._build_root)
+
+    def _build_root(self):
         # is always found, our models currently rely on the compound
         chem_name = self.chem_name
         compound_model = self.model.compound.model_class
@@ -393,7 +442,9 @@ class AutoSentenceParserOptionalCompound(BaseAutoParser, BaseSentenceParser):
 
     @property
     def root(self):
+        return self._cached_root(self._build_root)
 
+    def _build_root(self):
         entities = []
         if hasattr(self.model, 'dimensions') and not self.model.dimensions:
             # the mandatory elements of Dimensionless model are grouped into a entities list
@@ -531,6 +582,9 @@ class AutoTableParserOptionalCompound(BaseAutoParser, BaseTableParser):
 
     @property
     def root(self):
+        return self._cached_root(self._build_root)
+
+    def _build_root(self):
         entities = []
         chem_name = None
 
@@ -690,12 +744,11 @@ class AutoSentenceParserPerovskite(AutoSentenceParserOptionalCompound):
 
             # Check that the cem ends with a halogen anion
             raw_values = result.xpath('./raw_value')
-            end_match = r'((I)|(Cl)|(Br)|(F)|(At)|(Ts)|(\d+\.?\d*)|(x$)|(y$))+' # IF(Cl)(Br)(At)
             out_raw_values = []
             for val in raw_values:
                 raw_value = first(val.xpath('./text()'))
                 test_value = str(raw_value)[-3:]
-                if re.search(end_match, test_value):
+                if _perovskite_ending_pattern.search(test_value):
                     # Add condition to disallow raw values with 2 or less uppercase letters (to remove perovskite precursors)
                     if raw_value not in disallowed_perovskites and sum(1 for char in raw_value if char.isupper()) > 2 \
                             and any(char.isdigit() for char in raw_value) and len(raw_value) > 5:
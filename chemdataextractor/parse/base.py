@@ -121,9 +121,9 @@ class BaseSentenceParser(BaseParser):
         """
         # import lxml
         # from pprint import pprint
-        if self.trigger_phrase is not None:
-            trigger_phrase_results = [result for result in self.trigger_phrase.scan(tokens)]
-        if self.trigger_phrase is None or trigger_phrase_results:
+        # Only the first trigger phrase match matters, so stop scanning once one is found
+        trigger_phrase = self.trigger_phrase
+        if trigger_phrase is None or any(True for _ in trigger_phrase.scan(tokens, max_matches=1)):
             for result in self.root.scan(tokens):
                 # pprint(lxml.etree.tostring(result[0]))
                 for model in self.interpret(*result):
@@ -152,8 +152,9 @@ class BaseTableParser(BaseParser):
         """
         # import lxml
         # from pprint import pprint
-        if self.root is not None:
-            for result in self.root.scan(cell.tagged_tokens):
+        root = self.root
+        if root is not None:
+            for result in root.scan(cell.tagged_tokens):
                 try:
                     # pprint(lxml.etree.tostring(result[0]))
                     for model in self.interpret(*result):
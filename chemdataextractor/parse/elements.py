@@ -24,12 +24,21 @@ log = logging.getLogger(__name__)
 class ParseException(Exception):
     """Exception thrown by a ParserElement when it doesn't match input."""
 
-    def __init__(self, tokens, i=0, msg=None, element=None):
+    def __init__(self, tokens, i=0, msg=None, element=None, msg_args=None):
         self.i = i
-        self.msg = msg
+        self._msg = msg
+        #: Arguments for msg, only interpolated when the message is read. Most failed matches are simply discarded.
+        self._msg_args = msg_args
         self.tokens = tokens
         self.element = element
 
+    @property
+    def msg(self):
+        if self._msg_args is not None:
+            self._msg = self._msg % self._msg_args
+            self._msg_args = None
+        return self._msg
+
     @classmethod
     def wrap(cls, parse_exception):
         return cls(parse_exception.tokens, parse_exception.loc, parse_exception.msg, parse_exception.element)
@@ -278,7 +287,7 @@ class Word(BaseParserElement):
         token_text = tokens[i][0]
         if token_text == self.match:
             return [E(self.name or safe_name(tokens[i][1]), token_text)], i + 1
-        raise ParseException(tokens, i, 'Expected %s, got %s' % (self.match, token_text), self)
+        raise ParseException(tokens, i, 'Expected %s, got %s', self, (self.match, token_text))
 
 
 class Tag(BaseParserElement):
@@ -293,7 +302,7 @@ class Tag(BaseParserElement):
         tag = token[1]
         if tag == self.match:
             return [E(self.name or safe_name(tag), token[0])], i + 1
-        raise ParseException(tokens, i, 'Expected %s, got %s' % (self.match, tag), self)
+        raise ParseException(tokens, i, 'Expected %s, got %s', self, (self.match, tag))
 
 
 class IWord(Word):
@@ -306,7 +315,7 @@ class IWord(Word):
         token_text = tokens[i][0]
         if token_text.lower() == self.match:
             return [E(self.name or safe_name(tokens[i][1]), tokens[i][0])], i + 1
-        raise ParseException(tokens, i, 'Expected %s, got %s' % (self.match, tokens[i][0]), self)
+        raise ParseException(tokens, i, 'Expected %s, got %s', self, (self.match, token_text))
 
 
 class Regex(BaseParserElement):
@@ -328,12 +337,13 @@ class Regex(BaseParserElement):
         if result:
             text = token_text if self.group is None else result.group(self.group)
             return [E(self.name or safe_name(tokens[i][1]), text)], i + 1
-        raise ParseException(tokens, i, 'Expected %s, got %s' % (self.pattern, token_text), self)
+        raise ParseException(tokens, i, 'Expected %s, got %s', self, (self.pattern, token_text))
 
     # Solves issues with deepcopying of records, jm2111
     # only the pattern is copied and the object is created from scratch
+    # Compiled patterns are immutable, so the copy shares the already compiled regex (and its flags)
     def __deepcopy__(self, memodict={}):
-        return type(self)(deepcopy(self.pattern, memodict))
+        return type(self)(self.regex, group=self.group)
 
 
 class Start(BaseParserElement):
@@ -57,6 +57,16 @@ _open_bracket_pattern = re.compile('/\(')
 _division_pattern = re.compile('[/]\D*')
 # A regex pattern containing all the shorthand single letter magnitude indicators, that could be misconstrued as units
 _magnitude_indicators = re.compile('[pnμµ𝛍𝜇𝝁𝝻𝞵μmTGMkc]')
+# A regex pattern to split a value string into numbers, error signs and opening brackets, e.g. 123.4±5 or 123.4(5)
+_value_error_split_pattern = re.compile(r'(\d+\.?(?:\d+)?)|(±)|(\()')
+# A regex pattern to split a value string on spaces, keeping any hyphens
+_space_or_hyphen_pattern = re.compile(' |(-)')
+# A regex pattern to split a value string on brackets, keeping the brackets
+_brackets_split_pattern = re.compile(r'(\))|(\()')
+# Translation table standardising the dashes and decimal points in a value string
+_value_translation = {ord('–'): '-', ord('−'): '-', ord('・'): '.', ord('·'): '.'}
+# Translation table standardising the dashes in a unit string and removing spaces and middle dots
+_units_translation = {ord('–'): '-', ord('−'): '-', ord(' '): None, ord('·'): None}
 
 
 def value_element(units=(OneOrMore(T('NN')) | OneOrMore(T('NNP')) | OneOrMore(T('NNPS')) | OneOrMore(T('NNS')))('raw_units').add_action(merge)):
@@ -194,7 +204,7 @@ def extract_error(string):
     if string is None:
         return None
     string = _clean_value_string(string)
-    split_by_num_and_error = [r for r in re.split('(\d+\.?(?:\d+)?)|(±)|(\()', string) if r and r != " "]
+    split_by_num_and_error = [r for r in _value_error_split_pattern.split(string) if r and r != " "]
     error = None
     for index, value in enumerate(split_by_num_and_error):
         if value == '±':
@@ -233,7 +243,7 @@ def extract_value(string):
     for index, value in enumerate(new_split_by_num):
         try:
             # Add logic to identify fractions
-            if (re.match('/', value)):
+            if value.startswith('/'):
                 fraction_indicators.append((value, index))
             float_val = float(value)
             values.append(float_val)
@@ -243,14 +253,14 @@ def extract_value(string):
 
     # Substitute in fractions if required.
     fractions = []
-    blacklisted_indices = []
+    blacklisted_indices = set()
     for value, index in fraction_indicators:
         if index != 0 and index + 1 <= values_indices[-1]:
             for i in range(0, len(values)-1):
                 if values_indices[i] == index-1 and values_indices[i+1] == index + 1 and values[i+1] != 0:
                     fractions.append(values[i] / values[i+1])
-                    blacklisted_indices.append(values_indices[i])
-                    blacklisted_indices.append(values_indices[i+1])
+                    blacklisted_indices.add(values_indices[i])
+                    blacklisted_indices.add(values_indices[i+1])
 
     # Output with fraction numerators and denominators removed.
     values_with_removed_fractions = []
@@ -274,7 +284,7 @@ def _find_value_strings(string):
     string = _clean_value_string(string)
     string = string.split("±")[0]
     string = string.split("(")[0]
-    split_by_space = [r for r in re.split(' |(-)', string) if r]
+    split_by_space = [r for r in _space_or_hyphen_pattern.split(string) if r]
     split_by_num = []
     for elem in split_by_space:
         split_by_num.extend([r for r in re.split(_number_pattern, elem) if r])
@@ -307,11 +317,7 @@ def _clean_value_string(string):
     :returns: A cleaned version of the string
     :rtype: str
     """
-    string = string.replace("-", "-")
-    string = string.replace("–", "-")
-    string = string.replace("−", "-")
-    string = string.replace("・", ".")
-    string = string.replace("·", ".")
+    string = string.translate(_value_translation)
     split_by_comma = string.split(",")
     if len(split_by_comma) != 1:
         if len(split_by_comma) == 2:
@@ -333,7 +339,7 @@ def _extract_brackets_error(string):
     :returns: The error
     :rtype: float
     """
-    split_by_brackets = [r for r in re.split('(\))|(\()', string) if r]
+    split_by_brackets = [r for r in _brackets_split_pattern.split(string) if r]
     val_string = _find_value_strings(string)[0]
     magnitude = _get_magnitude(val_string)
     magnitude = magnitude if magnitude < 0 else 0
@@ -401,11 +407,7 @@ def extract_units(string, dimensions, strict=False):
         return None
     elif string is None:
         raise TypeError('None was passed in')
-    string = string.replace("-", "-")
-    string = string.replace("–", "-")
-    string = string.replace("−", "-")
-    string = string.replace(' ', '')
-    string = string.replace('·', '')
+    string = string.translate(_units_translation)
     if string[0] == '[' and string[-1] == ']':
         string = string[1:-1]
     # Split string at numbers, /s, and brackets, so we have the units tokenized into the right units for later processing stages.
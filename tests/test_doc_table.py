@@ -75,6 +75,18 @@ class TestTable(unittest.TestCase):
 
     maxDiff = None
 
+    def setUp(self):
+        # Tests swap the Compound parsers and toggle field flags, so put them back afterwards
+        self._compound_parsers = Compound.parsers
+        self._coordination_flags = [(field, field.required, field.contextual)
+                                    for field in (CoordinationNumber.cn_label, CoordinationNumber.compound)]
+
+    def tearDown(self):
+        Compound.parsers = self._compound_parsers
+        for field, required, contextual in self._coordination_flags:
+            field.required = required
+            field.contextual = contextual
+
     def do_table_1(self, expected):
         Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser()]
         table = Table(caption=Caption("This is my table."),
@@ -426,5 +438,25 @@ class TestTable(unittest.TestCase):
         Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser(), CompoundTableParser()]
 
 
+    def test_cells_reused_until_models_change(self):
+        table = Table(caption=Caption("Example table."),
+                      table_data="tests/data/tables/table_example_2.csv",
+                      models=[CoordinationNumber2])
+        result = _get_serialised_records(table.records, models=[CoordinationNumber2])
+        cells = {key: cde_tables for key, (models, cde_tables) in table._cde_tables_cache.items()}
+        self.assertTrue(result)
+        self.assertTrue(cells)
+        self.assertEqual(result, _get_serialised_records(table.records, models=[CoordinationNumber2]))
+        for key, (models, cde_tables) in table._cde_tables_cache.items():
+            self.assertIs(cde_tables, cells[key])
+
+        # Changing the models changes how the cells are tokenised, so they must be rebuilt
+        table.models = [CurieTemperature]
+        self.assertEqual([], _get_serialised_records(table.records, models=[CoordinationNumber2]))
+        for key, (models, cde_tables) in table._cde_tables_cache.items():
+            self.assertEqual((CurieTemperature,), models)
+            self.assertIsNot(cde_tables, cells[key])
+
+
 if __name__ == '__main__':
     unittest.main()
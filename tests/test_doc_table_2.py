@@ -4,16 +4,18 @@ Test the Table Document element and complex Table autoparsers.
 
 """
 
-from chemdataextractor.doc import Caption, Document
+from chemdataextractor.doc import Caption
 from chemdataextractor.doc.table import Table, Cell
 from chemdataextractor.model import TemperatureModel, StringType, Compound, ModelType, DimensionlessModel
-from chemdataextractor.parse.cem import CompoundParser, CompoundHeadingParser, ChemicalLabelParser, CompoundTableParser
+from chemdataextractor.parse.cem import CompoundParser, CompoundHeadingParser, ChemicalLabelParser
 from chemdataextractor.model.units.energy import EnergyModel
 from chemdataextractor.model.pv_model import OpenCircuitVoltage, ShortCircuitCurrentDensity, FillFactor, PowerConversionEfficiency, Dye
 from chemdataextractor.model.model import BaseModel
 from chemdataextractor.parse import W, R, Any
 from chemdataextractor.parse.auto import AutoTableParser, AutoTableParserOptionalCompound, AutoSentenceParserOptionalCompound
+from chemdataextractor.utils import memoize
 
+from contextlib import contextmanager
 import logging
 import unittest
 import os
@@ -50,6 +52,100 @@ class CurieTemperature(TemperatureModel):
     parsers = [AutoTableParser()]
 
 
+# Submodel fields whose flags are changed by the tests, keyed by the name used in _submodel_flags
+_SUBMODEL_FIELDS = {'absent': Enthalpy.absent,
+                    'enthalpy': Reference.enthalpy,
+                    'reference': CurieTemperature.reference}
+
+
+@contextmanager
+def _submodel_flags(**flags):
+    """
+    Set the ``required``/``contextual`` flags of the nested submodel fields, e.g.
+    ``_submodel_flags(absent_required=False, reference_contextual=True)``, restoring the previous flags
+    on exit, even if the test fails.
+    """
+    saved = {name: (field.required, field.contextual) for name, field in _SUBMODEL_FIELDS.items()}
+    try:
+        for key, value in flags.items():
+            name, flag = key.rsplit('_', 1)
+            setattr(_SUBMODEL_FIELDS[name], flag, value)
+        yield
+    finally:
+        for name, (required, contextual) in saved.items():
+            _SUBMODEL_FIELDS[name].required = required
+            _SUBMODEL_FIELDS[name].contextual = contextual
+
+
+# Serialised unit strings used in the expected records
+_K_UNIT = 'Kelvin^(1.0)'
+_KJ_UNIT = '(10^3.0) * Joule^(1.0)'
+_MA_CM2_UNIT = '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)'
+_MV_UNIT = '(10^-3.0) * Volt^(1.0)'
+_V_UNIT = 'Volt^(1.0)'
+_PCT_UNIT = 'Percent^(1.0)'
+
+# Compound parsers used for the nested table, created once and shared between tests
+_NESTED_TABLE_COMPOUND_PARSERS = (CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser())
+
+def _values(raw_value):
+    return [float(value) for value in raw_value.split('–')]
+
+
+def _ct(tc, name, ref=None, enth=None):
+    """Build the expected serialised CurieTemperature record for a row of the nested table."""
+    curie_temperature = {'raw_value': tc, 'raw_units': '(K)', 'value': _values(tc), 'units': _K_UNIT, 'specifier': 'TC', 'compound': {'Compound': {'names': [name]}}}
+    if ref is not None:
+        reference = {'raw_value': ref, 'value': _values(ref), 'specifier': 'Ref', 'compound': {'Compound': {'names': [name]}}}
+        if enth is not None:
+            reference['enthalpy'] = {'Enthalpy': {'raw_value': enth, 'raw_units': '(kJ)', 'value': _values(enth), 'units': _KJ_UNIT, 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': [name]}}}}
+        curie_temperature['reference'] = {'Reference': reference}
+    return {'CurieTemperature': curie_temperature}
+
+
+# Rows of table_example_3.csv as (Curie temperature, compound, reference, enthalpy)
+_NESTED_TABLE_ROWS = (
+    ('293', 'MnO2', '52–55', '5'),
+    ('293', 'MnO2', '56', '1'),
+    ('337', 'La2', '57', '1'),
+    ('292', 'La0.67Ba0.33', '26', '5'),
+    ('252', 'La0.67Ca0.33', '26', '5'),
+    ('312', 'La0.67Sr0.33MnO3', '58', '1.5'),
+    ('321', 'La0.67Sr0.33MnO3', '58', '1.5'),
+    ('309', 'Ba0.33Mn0.98Ti0.02O3', '39', '1'),
+    ('309', 'Ba0.33Mn0.98Ti0.02O3', '39', '5'),
+    ('286', 'Ba0.33Mn0.98Ti0.02O3', '286', '5'),
+    ('286', 'Ba0.33Mn0.98Ti0.02O3', '286', '1'),
+)
+
+
+def _expected_records(columns):
+    """
+    Expected CurieTemperature records for table_example_3.csv, keeping only the first ``columns`` entries
+    of each row (e.g. 3 drops the enthalpy). Rows that then become identical are only expected once.
+    A new list is built on every call, so a test can never see changes made by another.
+    """
+    rows = []
+    for row in _NESTED_TABLE_ROWS:
+        if row[:columns] not in rows:
+            rows.append(row[:columns])
+    return [_ct(*row) for row in rows]
+
+
+# Combinations of submodel flags, with the number of columns of _NESTED_TABLE_ROWS found in the records
+# for each. The first combination requires a non-contextual AbsentModel, so no records are found at all.
+_REQUIRED_SUBMODEL_CASES = (
+    (dict(absent_required=True, absent_contextual=False, enthalpy_required=True, enthalpy_contextual=False, reference_required=True, reference_contextual=False), None),
+    (dict(absent_required=False, enthalpy_required=True, reference_required=True), 4),
+    (dict(absent_required=True, absent_contextual=False, enthalpy_required=False, reference_required=True), 3),
+    (dict(absent_required=False, enthalpy_required=False, reference_required=True), 4),
+    (dict(absent_required=True, absent_contextual=False, enthalpy_required=True, enthalpy_contextual=False, reference_required=False), 2),
+    (dict(absent_required=False, enthalpy_required=True, reference_required=False), 4),
+    (dict(absent_required=True, absent_contextual=False, enthalpy_required=False, reference_required=False), 3),
+    (dict(absent_required=False, enthalpy_required=False, reference_required=False), 4),
+)
+
+
 def _get_serialised_records(records, models=None):
     serialized_list = []
     for record in records:
@@ -68,198 +164,39 @@ class TestNestedTable(unittest.TestCase):
 
     maxDiff = None
 
-    def do_table(self, expected):
-        Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser()]
+    @classmethod
+    def setUpClass(cls):
+        cls.saved_parsers = Compound.parsers
+        # The table structure does not depend on the submodel flags, so the CSV is only read and analysed once.
+        # The records are still extracted separately in each test.
         table_data_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'data', 'tables', 'table_example_3.csv')
-        table = Table(caption=Caption(""),
-                      table_data=table_data_path,
-                      models=[CurieTemperature])
-        result = _get_serialised_records(table.records, models=[CurieTemperature])
-        self.assertEqual(expected, result)
-        Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser(), CompoundTableParser()]
-        Enthalpy.absent.required = True
-        Enthalpy.absent.contextual = True
-        Reference.enthalpy.required = True
-        Reference.enthalpy.contextual = True
-        CurieTemperature.reference.required = True
-        CurieTemperature.reference.contextual = True
-
-    def test_required_submodels_1(self):
-        """
-        Tests a combination of `required` parameters for submodels.
-        """
-        Enthalpy.absent.required = True
-        Enthalpy.absent.contextual = False
-        Reference.enthalpy.required = True
-        Reference.enthalpy.contextual = False
-        CurieTemperature.reference.required = True
-        CurieTemperature.reference.contextual = False
-        expected = []
-        self.do_table(expected)
-
-    def test_required_submodels_2(self):
-        """
-        Tests a combination of `required` parameters for submodels.
-        """
-        Enthalpy.absent.required = False
-        Reference.enthalpy.required = True
-        CurieTemperature.reference.required = True
-        expected = [
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '52–55', 'value': [52.0, 55.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '56', 'value': [56.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '337', 'raw_units': '(K)', 'value': [337.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La2']}}, 'reference': {'Reference': {'raw_value': '57', 'value': [57.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '292', 'raw_units': '(K)', 'value': [292.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}}
-        ]
-        self.do_table(expected)
+        cls.table = Table(caption=Caption(""),
+                          table_data=table_data_path,
+                          models=[CurieTemperature])
 
-    def test_required_submodels_3(self):
-        """
-        Tests a combination of `required` parameters for submodels.
-        """
-        Enthalpy.absent.required = True
-        Enthalpy.absent.contextual = False
-        Reference.enthalpy.required = False
-        CurieTemperature.reference.required = True
-        expected = [
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '52–55', 'value': [52.0, 55.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}}}}},
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '56', 'value': [56.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}}}}},
-            {'CurieTemperature': {'raw_value': '337', 'raw_units': '(K)', 'value': [337.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La2']}}, 'reference': {'Reference': {'raw_value': '57', 'value': [57.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La2']}}}}}},
-            {'CurieTemperature': {'raw_value': '292', 'raw_units': '(K)', 'value': [292.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}}}}},
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}
-        ]
-        self.do_table(expected)
+    def setUp(self):
+        Compound.parsers = list(_NESTED_TABLE_COMPOUND_PARSERS)
 
-    def test_required_submodels_4(self):
-        """
-        Tests a combination of `required` parameters for submodels.
-        """
-        Enthalpy.absent.required = False
-        Reference.enthalpy.required = False
-        CurieTemperature.reference.required = True
-        expected = [
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '52–55', 'value': [52.0, 55.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '56', 'value': [56.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '337', 'raw_units': '(K)', 'value': [337.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La2']}}, 'reference': {'Reference': {'raw_value': '57', 'value': [57.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '292', 'raw_units': '(K)', 'value': [292.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}}
-        ]
-        self.do_table(expected)
+    def tearDown(self):
+        Compound.parsers = self.saved_parsers
 
-    def test_required_submodels_5(self):
-        """
-        Tests a combination of `required` parameters for submodels.
-        """
-        Enthalpy.absent.required = True
-        Enthalpy.absent.contextual = False
-        Reference.enthalpy.required = True
-        Reference.enthalpy.contextual = False
-        CurieTemperature.reference.required = False
-        expected = [
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}}},
-            {'CurieTemperature': {'raw_value': '337', 'raw_units': '(K)', 'value': [337.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La2']}}}},
-            {'CurieTemperature': {'raw_value': '292', 'raw_units': '(K)', 'value': [292.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}}},
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}
-        ]
-        self.do_table(expected)
-
-    def test_required_submodels_6(self):
-        """
-        Tests a combination of `required` parameters for submodels.
-        """
-        Enthalpy.absent.required = False
-        Reference.enthalpy.required = True
-        CurieTemperature.reference.required = False
-        expected = [
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '52–55', 'value': [52.0, 55.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '56', 'value': [56.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '337', 'raw_units': '(K)', 'value': [337.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La2']}}, 'reference': {'Reference': {'raw_value': '57', 'value': [57.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '292', 'raw_units': '(K)', 'value': [292.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}}
-        ]
-        self.do_table(expected)
-
-    def test_required_submodels_7(self):
-        """
-        Tests a combination of `required` parameters for submodels.
-        """
-        Enthalpy.absent.required = True
-        Enthalpy.absent.contextual = False
-        Reference.enthalpy.required = False
-        CurieTemperature.reference.required = False
-        expected = [
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '52–55', 'value': [52.0, 55.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}}}}},
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '56', 'value': [56.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}}}}},
-            {'CurieTemperature': {'raw_value': '337', 'raw_units': '(K)', 'value': [337.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La2']}}, 'reference': {'Reference': {'raw_value': '57', 'value': [57.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La2']}}}}}},
-            {'CurieTemperature': {'raw_value': '292', 'raw_units': '(K)', 'value': [292.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}}}}},
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}
-        ]
-        self.do_table(expected)
+    def do_table(self, expected):
+        result = _get_serialised_records(self.table.records, models=[CurieTemperature])
+        self.assertEqual(expected, result)
 
-    def test_required_submodels_8(self):
+    def test_required_submodels(self):
         """
-        Tests a combination of `required` parameters for submodels.
+        Tests combinations of `required` parameters for submodels.
         """
-        Enthalpy.absent.required = False
-        Reference.enthalpy.required = False
-        CurieTemperature.reference.required = False
-        expected = [
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '52–55', 'value': [52.0, 55.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '293', 'raw_units': '(K)', 'value': [293.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['MnO2']}}, 'reference': {'Reference': {'raw_value': '56', 'value': [56.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['MnO2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['MnO2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '337', 'raw_units': '(K)', 'value': [337.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La2']}}, 'reference': {'Reference': {'raw_value': '57', 'value': [57.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La2']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La2']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '292', 'raw_units': '(K)', 'value': [292.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ba0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}}
-        ]
-        self.do_table(expected)
+        for flags, columns in _REQUIRED_SUBMODEL_CASES:
+            expected = _expected_records(columns) if columns else []
+            with self.subTest(**flags), _submodel_flags(**flags):
+                self.do_table(expected)
 
     def test_requires_submodels_from_list(self):
         """
         Tests a subset of the table
         """
-        # Set the default settings
-        Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser(), CompoundTableParser()]
-
-        # Specific test settings
-        Enthalpy.absent.required = False
-        Reference.enthalpy.required = True
-        CurieTemperature.reference.required = True
-
         input = [["Composition","TC (K)","Enthalpy (kJ)","−S diff(J kg−1 K)","CCK (J kg−1)","Ref."],
                  ['La0.67Ca0.33(TF)', '252', '5', '2.08', '175', '26'],
                  ['La0.67Sr0.33MnO3(TF)', '312', '1.5', '1.54', '50.16', '58'],
@@ -269,29 +206,15 @@ class TestNestedTable(unittest.TestCase):
                  ['Ba0.33Mn0.98Ti0.02O3(TF)', '286', '5', '3.35', '220', 'This work'],
                  ['Ba0.33Mn0.98Ti0.02O3(TF)', '286', '1', '0.99', '49', 'This work']
                  ]
-        expected = [
-            {'CurieTemperature': {'raw_value': '252', 'raw_units': '(K)', 'value': [252.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'reference': {'Reference': {'raw_value': '26', 'value': [26.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Ca0.33']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '312', 'raw_units': '(K)', 'value': [312.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '321', 'raw_units': '(K)', 'value': [321.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'reference': {'Reference': {'raw_value': '58', 'value': [58.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1.5', 'raw_units': '(kJ)', 'value': [1.5], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['La0.67Sr0.33MnO3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '286', 'raw_units': '(K)', 'value': [286.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '286', 'value': [286.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '1', 'raw_units': '(kJ)', 'value': [1.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-            {'CurieTemperature': {'raw_value': '309', 'raw_units': '(K)', 'value': [309.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TC', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'reference': {'Reference': {'raw_value': '39', 'value': [39.0], 'specifier': 'Ref', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}, 'enthalpy': {'Enthalpy': {'raw_value': '5', 'raw_units': '(kJ)', 'value': [5.0], 'units': '(10^3.0) * Joule^(1.0)', 'specifier': 'Enthalpy', 'compound': {'Compound': {'names': ['Ba0.33Mn0.98Ti0.02O3']}}}}}}}},
-       ]
-        Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser()]
-        table = Table(caption=Caption(""),
-                      table_data=input,
-                      models=[CurieTemperature])
-        result = _get_serialised_records(table.records, models=[CurieTemperature])
+        # The input holds the last seven rows of the full table, and the comparison ignores order
+        expected = [_ct(*row) for row in _NESTED_TABLE_ROWS[4:]]
+        with _submodel_flags(absent_required=False, enthalpy_required=True, reference_required=True):
+            table = Table(caption=Caption(""),
+                          table_data=input,
+                          models=[CurieTemperature])
+            result = _get_serialised_records(table.records, models=[CurieTemperature])
 
         self.assertCountEqual(expected, result)
-        Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser(), CompoundTableParser()]
-        Enthalpy.absent.required = True
-        Enthalpy.absent.contextual = True
-        Reference.enthalpy.required = True
-        Reference.enthalpy.contextual = True
-        CurieTemperature.reference.required = True
-        CurieTemperature.reference.contextual = True
 
 
 # DEFINE A SIMPLE PV PARSER
@@ -307,70 +230,79 @@ class SimplePhotovoltaicDevice(BaseModel):
     parsers = [AutoTableParserOptionalCompound(), AutoSentenceParserOptionalCompound()]
 
 
+@memoize
+def _parser_for(model):
+    """Return a table parser for the given model, shared between tests."""
+    parser = AutoTableParserOptionalCompound()
+    parser.model = model
+    return parser
+
+
+LH_INPUT = [['Dye',	'Jsc (mA cm−2)', 'Voc (V)', 'FF', 'PCE'], ['DPTP', '11.11', '22.22', '33.33', '44.44'], ['N719','55.55','66.66', '77.77', '88.88']]
+
+NESTED_INPUT_1 = [['Dye','CV scans', 'Illumination W/m2', 'Voc mV', 'Jsc mA/cm2', 'ff', 'η/%'],
+                  ['D5', '0', '1000', '333','3.41','0.35','0.39'],
+                  ['D5','3','1000','465','2.71','0.38','0.48'],
+                  ['D5','Ref [28]','1000','660','11.9','0.68','4–5'],
+                  ['D35','3','1000','660','2.71','0.48','0.85'],
+                  ['D35','5','1000','667','2.53','0.49','0.82'],
+                  ['D35','Ref [29]','1000','920','10.7','0.68','6.7']
+                  ]
+
+
 class TestTablePVCell(unittest.TestCase):
     """ Testing complex nested tables for photovoltaic tables"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Parse each input table once for the whole class
+        lh_table = Table(caption=Caption(''), table_data=LH_INPUT, models=[SimplePhotovoltaicDevice])
+        cls.lh_spd_records = _get_serialised_records(lh_table.records, models=[SimplePhotovoltaicDevice])
+        nested_table = Table(caption=Caption(''), table_data=NESTED_INPUT_1, models=[SimplePhotovoltaicDevice])
+        cls.nested_spd_records = _get_serialised_records(nested_table.records, models=[SimplePhotovoltaicDevice])
+
     def test_LH_column_merging(self):
         """This test ensures that the LH column in a table gets merges when appropriate"""
 
-        table_input = [['Dye',	'Jsc (mA cm−2)', 'Voc (V)', 'FF', 'PCE'], ['DPTP', '11.11', '22.22', '33.33', '44.44'], ['N719','55.55','66.66', '77.77', '88.88']]
-        table = Table(caption=Caption(''), table_data=table_input, models=[SimplePhotovoltaicDevice])
-
-        expected_1 = {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '22.22', 'raw_units': '(V)', 'value': [22.22], 'units': 'Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '33.33', 'value': [33.33], 'specifier': 'FF'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '44.44', 'value': [44.44], 'specifier': 'PCE'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '11.11', 'raw_units': '(mAcm−2)', 'value': [11.11], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'DPTP'}}}}
-        expected_2 = {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '66.66', 'raw_units': '(V)', 'value': [66.66], 'units': 'Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '77.77', 'value': [77.77], 'specifier': 'FF'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '88.88', 'value': [88.88], 'specifier': 'PCE'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '55.55', 'raw_units': '(mAcm−2)', 'value': [55.55], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'N719'}}}}
+        expected_1 = {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '22.22', 'raw_units': '(V)', 'value': [22.22], 'units': _V_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '33.33', 'value': [33.33], 'specifier': 'FF'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '44.44', 'value': [44.44], 'specifier': 'PCE'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '11.11', 'raw_units': '(mAcm−2)', 'value': [11.11], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'DPTP'}}}}
+        expected_2 = {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '66.66', 'raw_units': '(V)', 'value': [66.66], 'units': _V_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '77.77', 'value': [77.77], 'specifier': 'FF'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '88.88', 'value': [88.88], 'specifier': 'PCE'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '55.55', 'raw_units': '(mAcm−2)', 'value': [55.55], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'N719'}}}}
         expected = [expected_1, expected_2]
 
-        # Get the results that are SimplePhotovoltaicDevice objects
-        spd_records = [record.serialize() for record in table.records if 'SimplePhotovoltaicDevice' in record.serialize().keys()]
-
-        self.assertCountEqual(expected, spd_records)
+        self.assertCountEqual(expected, self.lh_spd_records)
         
     def test_unusual_hyphen_included(self):
         
         cell_string = '7.53 sdfkljlk N719 sdfkljlk Jsc mAcm–2'
         cell = Cell(cell_string)
-        parser = AutoTableParserOptionalCompound()
-        parser.model = ShortCircuitCurrentDensity
+        parser = _parser_for(ShortCircuitCurrentDensity)
         results = list(parser.parse_cell(cell))
 
-        self.assertEqual(results[0].serialize(), {'ShortCircuitCurrentDensity': {'raw_value': '7.53', 'raw_units': 'mAcm–2', 'value': [7.53], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}})
+        self.assertEqual(results[0].serialize(), {'ShortCircuitCurrentDensity': {'raw_value': '7.53', 'raw_units': 'mAcm–2', 'value': [7.53], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}})
 
     def test_voc_cde_table_format_parsing(self):
         cell_string = '0.67 sdfkljlk 6 sdfkljlk Open circuit voltage (Voc) (V)'
         cell = Cell(cell_string)
-        parser = AutoTableParserOptionalCompound()
-        parser.model = OpenCircuitVoltage
+        parser = _parser_for(OpenCircuitVoltage)
         results = list(parser.parse_cell(cell))
         expected = {'OpenCircuitVoltage': {'raw_units': '(V)',
                         'raw_value': '0.67',
                         'specifier': 'Voc',
-                        'units': 'Volt^(1.0)',
+                        'units': _V_UNIT,
                         'value': [0.67]}}
         self.assertEqual(results[0].serialize(), expected)
 
 
     def test_nested_tables_1(self):
 
-        table_input = [['Dye','CV scans', 'Illumination W/m2', 'Voc mV', 'Jsc mA/cm2', 'ff', 'η/%'],
-                       ['D5', '0', '1000', '333','3.41','0.35','0.39'],
-                       ['D5','3','1000','465','2.71','0.38','0.48'],
-                       ['D5','Ref [28]','1000','660','11.9','0.68','4–5'],
-                       ['D35','3','1000','660','2.71','0.48','0.85'],
-                       ['D35','5','1000','667','2.53','0.49','0.82'],
-                       ['D35','Ref [29]','1000','920','10.7','0.68','6.7']
-                       ]
-        table = Table(caption=Caption(''), table_data=table_input, models=[SimplePhotovoltaicDevice])
-        spd_records = [record.serialize() for record in table.records if 'SimplePhotovoltaicDevice' in record.serialize().keys()]
-
-        expected = [{'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '333', 'raw_units': 'mV', 'value': [333.0], 'units': '(10^-3.0) * Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.35', 'value': [0.35], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.39', 'raw_units': '%', 'value': [0.39], 'units': 'Percent^(1.0)', 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '3.41', 'raw_units': 'mA/cm2', 'value': [3.41], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D5'}}}},
-            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '465', 'raw_units': 'mV', 'value': [465.0], 'units': '(10^-3.0) * Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.38', 'value': [0.38], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.48', 'raw_units': '%', 'value': [0.48], 'units': 'Percent^(1.0)', 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '2.71', 'raw_units': 'mA/cm2', 'value': [2.71], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D5'}}}},
-            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '660', 'raw_units': 'mV', 'value': [660.0], 'units': '(10^-3.0) * Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.68', 'value': [0.68], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '4–5', 'raw_units': '%', 'value': [4.0, 5.0], 'units': 'Percent^(1.0)', 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '11.9', 'raw_units': 'mA/cm2', 'value': [11.9], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D5'}}}},
-            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '660', 'raw_units': 'mV', 'value': [660.0], 'units': '(10^-3.0) * Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.48', 'value': [0.48], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.85', 'raw_units': '%', 'value': [0.85], 'units': 'Percent^(1.0)', 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '2.71', 'raw_units': 'mA/cm2', 'value': [2.71], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D35'}}}},
-            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '667', 'raw_units': 'mV', 'value': [667.0], 'units': '(10^-3.0) * Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.49', 'value': [0.49], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.82', 'raw_units': '%', 'value': [0.82], 'units': 'Percent^(1.0)', 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '2.53', 'raw_units': 'mA/cm2', 'value': [2.53], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D35'}}}},
-            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '920', 'raw_units': 'mV', 'value': [920.0], 'units': '(10^-3.0) * Volt^(1.0)', 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.68', 'value': [0.68], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '6.7', 'raw_units': '%', 'value': [6.7], 'units': 'Percent^(1.0)', 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '10.7', 'raw_units': 'mA/cm2', 'value': [10.7], 'units': '(10^1.0) * Ampere^(1.0)  Meter^(-2.0)', 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D35'}}}}
+        expected = [{'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '333', 'raw_units': 'mV', 'value': [333.0], 'units': _MV_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.35', 'value': [0.35], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.39', 'raw_units': '%', 'value': [0.39], 'units': _PCT_UNIT, 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '3.41', 'raw_units': 'mA/cm2', 'value': [3.41], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D5'}}}},
+            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '465', 'raw_units': 'mV', 'value': [465.0], 'units': _MV_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.38', 'value': [0.38], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.48', 'raw_units': '%', 'value': [0.48], 'units': _PCT_UNIT, 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '2.71', 'raw_units': 'mA/cm2', 'value': [2.71], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D5'}}}},
+            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '660', 'raw_units': 'mV', 'value': [660.0], 'units': _MV_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.68', 'value': [0.68], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '4–5', 'raw_units': '%', 'value': [4.0, 5.0], 'units': _PCT_UNIT, 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '11.9', 'raw_units': 'mA/cm2', 'value': [11.9], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D5'}}}},
+            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '660', 'raw_units': 'mV', 'value': [660.0], 'units': _MV_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.48', 'value': [0.48], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.85', 'raw_units': '%', 'value': [0.85], 'units': _PCT_UNIT, 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '2.71', 'raw_units': 'mA/cm2', 'value': [2.71], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D35'}}}},
+            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '667', 'raw_units': 'mV', 'value': [667.0], 'units': _MV_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.49', 'value': [0.49], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '0.82', 'raw_units': '%', 'value': [0.82], 'units': _PCT_UNIT, 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '2.53', 'raw_units': 'mA/cm2', 'value': [2.53], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D35'}}}},
+            {'SimplePhotovoltaicDevice': {'voc': {'OpenCircuitVoltage': {'raw_value': '920', 'raw_units': 'mV', 'value': [920.0], 'units': _MV_UNIT, 'specifier': 'Voc'}}, 'ff': {'FillFactor': {'raw_value': '0.68', 'value': [0.68], 'specifier': 'ff'}}, 'pce': {'PowerConversionEfficiency': {'raw_value': '6.7', 'raw_units': '%', 'value': [6.7], 'units': _PCT_UNIT, 'specifier': 'η'}}, 'jsc': {'ShortCircuitCurrentDensity': {'raw_value': '10.7', 'raw_units': 'mA/cm2', 'value': [10.7], 'units': _MA_CM2_UNIT, 'specifier': 'Jsc'}}, 'dye': {'Dye': {'specifier': 'Dye', 'raw_value': 'D35'}}}}
         ]
 
-        self.assertCountEqual(spd_records, expected)
+        self.assertCountEqual(self.nested_spd_records, expected)
 
 if __name__ == '__main__':
     unittest.main()
@@ -81,6 +81,11 @@ class TestText(unittest.TestCase):
         self.assertEqual(type(title.sentence_tokenizer), ChemSentenceTokenizer)
         self.assertEqual(type(title.word_tokenizer), ChemWordTokenizer)
 
+    def test_empty_caption_has_no_sentences(self):
+        caption = Caption('')
+        self.assertEqual(caption.sentences, [])
+        self.assertEqual(list(caption.records), [])
+
     def test_tde_spacer_not_CEM(self):
 
         tokens = ['N719', ['1T–MoS2 (hydrothermal, 180 °C)'], ['Dye']]
@@ -18,11 +18,8 @@ from chemdataextractor.model import Compound, MeltingPoint, UvvisSpectrum, Appar
 from chemdataextractor.model.units.temperature import TemperatureModel
 from chemdataextractor.parse.elements import I
 from chemdataextractor.model.base import StringType, ModelType
-from chemdataextractor.doc.text import Sentence, Caption
-from chemdataextractor.doc.table import Table
+from chemdataextractor.doc.text import Sentence
 from chemdataextractor.parse.auto import AutoSentenceParser
-from chemdataextractor.doc import Document
-from lxml import etree
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
 
@@ -34,6 +31,26 @@ class NeelTemperature(TemperatureModel):
     compound = ModelType(Compound, required=False, contextual=True)
     parsers = [AutoSentenceParser()]
 
+
+class _RequiredA(BaseModel):
+    attribute_1 = StringType(required=True)
+    attribute_2 = StringType(required=False)
+
+
+class _RequiredB(BaseModel):
+    a = ModelType(_RequiredA, required=False)
+
+
+class _A(BaseModel):
+    attribute_1 = StringType()
+    attribute_2 = StringType()
+
+
+class _B(BaseModel):
+    a = ModelType(_A)
+    attribute_1 = StringType()
+
+
 class TestModel(unittest.TestCase):
 
     maxDiff = None
@@ -56,85 +73,72 @@ class TestModel(unittest.TestCase):
         self.assertEqual(MeltingPoint(value=[240]).contextual_fulfilled, False)
         self.assertEqual(MeltingPoint(raw_units='K').contextual_fulfilled, False)
         self.assertEqual(MeltingPoint(apparatus=Apparatus(apparatus='Some apparatus')).contextual_fulfilled, False)
-        Compound.fields['names'].contextual = True
-        compound = Compound()
-        spectrum = UvvisSpectrum(solvent='solvent',
-                                 temperature='temperature',
-                                 temperature_units='units',
-                                 concentration='concentration',
-                                 concentration_units='units')
-        self.assertEqual(spectrum.contextual_fulfilled, False)
-        spectrum.apparatus = Apparatus(apparatus_name='Some apparatus')
-        self.assertEqual(spectrum.contextual_fulfilled, True)
-        spectrum.compound = compound
-        self.assertEqual(spectrum.contextual_fulfilled, False)
-        spectrum.compound.names = ['Names']
-        self.assertEqual(spectrum.contextual_fulfilled, True)
-        Compound.fields['names'].contextual = False
+        names_field = Compound.fields['names']
+        contextual = names_field.contextual
+        names_field.contextual = True
+        try:
+            compound = Compound()
+            spectrum = UvvisSpectrum(solvent='solvent',
+                                     temperature='temperature',
+                                     temperature_units='units',
+                                     concentration='concentration',
+                                     concentration_units='units')
+            self.assertEqual(spectrum.contextual_fulfilled, False)
+            spectrum.apparatus = Apparatus(apparatus_name='Some apparatus')
+            self.assertEqual(spectrum.contextual_fulfilled, True)
+            spectrum.compound = compound
+            self.assertEqual(spectrum.contextual_fulfilled, False)
+            spectrum.compound.names = ['Names']
+            self.assertEqual(spectrum.contextual_fulfilled, True)
+        finally:
+            names_field.contextual = contextual
 
     def test_required_fulfilled(self):
-        class A(BaseModel):
-            attribute_1 = StringType(required=True)
-            attribute_2 = StringType(required=False)
-
-        class B(BaseModel):
-            a = ModelType(A, required=False)
-
-        a = A(attribute_2='Test')
+        a = _RequiredA(attribute_2='Test')
         self.assertFalse(a.required_fulfilled)
-        b = B(a=a)
+        b = _RequiredB(a=a)
         self.assertTrue(b.required_fulfilled)
-        B.fields['a'].required = True
-        b = B(a=a)
-        self.assertFalse(b.required_fulfilled)
-
-    def test_model_update_definitions(self):
-        """Test that the model parse expressions update method.
-        """
-        elements = [Sentence('Here we define the Néel temperature, TN')]
-        definitions = elements[0].definitions
-        NeelTemperature.update(definitions)
-        test_sentence = Sentence('TN = 300 K')
-        results = [i for i in NeelTemperature.parsers[0].parse_sentence(test_sentence.tagged_tokens)][0].serialize()
-
-        self.assertEqual(results, {'NeelTemperature': {'raw_value': '300', 'raw_units': 'K', 'value': [300.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TN'}})
+        a_field = _RequiredB.fields['a']
+        required = a_field.required
+        a_field.required = True
+        try:
+            b = _RequiredB(a=a)
+            self.assertFalse(b.required_fulfilled)
+        finally:
+            a_field.required = required
 
     def test_is_superset(self):
-        class A(BaseModel):
-            attribute_1 = StringType()
-            attribute_2 = StringType()
-
-        class B(BaseModel):
-            a = ModelType(A)
-            attribute_1 = StringType()
-
         a_list = [
-            A(),
-            A(attribute_2='test'),
-            A(attribute_1='test'),
-            A(attribute_1='test', attribute_2='test'),
+            _A(),
+            _A(attribute_2='test'),
+            _A(attribute_1='test'),
+            _A(attribute_1='test', attribute_2='test'),
         ]
         for i in range(1, 4):
-            self.assertFalse(a_list[0].is_superset(a_list[i]))
+            with self.subTest(i=i):
+                self.assertFalse(a_list[0].is_superset(a_list[i]))
         for i in range(3):
-            self.assertTrue(a_list[-1].is_superset(a_list[i]))
+            with self.subTest(i=i):
+                self.assertTrue(a_list[-1].is_superset(a_list[i]))
         self.assertFalse(a_list[1].is_superset(a_list[2]))
         self.assertTrue(a_list[0].is_superset(a_list[0]))
         self.assertFalse(a_list[1].is_superset(a_list[3]))
         b_list = [
-            B(),
-            B(attribute_1='test'),
-            B(a=a_list[0]),
-            B(a=a_list[1]),
-            B(attribute_1='test', a=a_list[0]),
-            B(attribute_1='test', a=a_list[1]),
-            B(attribute_1='test', a=a_list[-1]),
+            _B(),
+            _B(attribute_1='test'),
+            _B(a=a_list[0]),
+            _B(a=a_list[1]),
+            _B(attribute_1='test', a=a_list[0]),
+            _B(attribute_1='test', a=a_list[1]),
+            _B(attribute_1='test', a=a_list[-1]),
         ]
-        for i in range(1, len(b_list)):
-            self.assertFalse(b_list[0].is_superset(b_list[i]))
-        for i in range(len(b_list) - 1):
-            print(i)
-            self.assertTrue(b_list[-1].is_superset(b_list[i]))
+        n_b = len(b_list)
+        for i in range(1, n_b):
+            with self.subTest(i=i):
+                self.assertFalse(b_list[0].is_superset(b_list[i]))
+        for i in range(n_b - 1):
+            with self.subTest(i=i):
+                self.assertTrue(b_list[-1].is_superset(b_list[i]))
         self.assertTrue(b_list[-1].is_superset(b_list[-1]))
         self.assertTrue(b_list[5].is_superset(b_list[4]))
         self.assertFalse(b_list[4].is_superset(b_list[5]))
@@ -143,41 +147,37 @@ class TestModel(unittest.TestCase):
         self.assertTrue(b_list[2].is_superset(b_list[0]))
 
     def test_is_subset(self):
-        class A(BaseModel):
-            attribute_1 = StringType()
-            attribute_2 = StringType()
-
-        class B(BaseModel):
-            a = ModelType(A)
-            attribute_1 = StringType()
-
         a_list = [
-            A(),
-            A(attribute_2='test'),
-            A(attribute_1='test'),
-            A(attribute_1='test', attribute_2='test'),
+            _A(),
+            _A(attribute_2='test'),
+            _A(attribute_1='test'),
+            _A(attribute_1='test', attribute_2='test'),
         ]
         for i in range(1, 4):
-            self.assertTrue(a_list[0].is_subset(a_list[i]))
+            with self.subTest(i=i):
+                self.assertTrue(a_list[0].is_subset(a_list[i]))
         for i in range(3):
-            self.assertFalse(a_list[-1].is_subset(a_list[i]))
+            with self.subTest(i=i):
+                self.assertFalse(a_list[-1].is_subset(a_list[i]))
         self.assertFalse(a_list[1].is_subset(a_list[2]))
         self.assertTrue(a_list[0].is_subset(a_list[0]))
         self.assertTrue(a_list[1].is_subset(a_list[3]))
         b_list = [
-            B(),
-            B(attribute_1='test'),
-            B(a=a_list[0]),
-            B(a=a_list[1]),
-            B(attribute_1='test', a=a_list[0]),
-            B(attribute_1='test', a=a_list[1]),
-            B(attribute_1='test', a=a_list[-1]),
+            _B(),
+            _B(attribute_1='test'),
+            _B(a=a_list[0]),
+            _B(a=a_list[1]),
+            _B(attribute_1='test', a=a_list[0]),
+            _B(attribute_1='test', a=a_list[1]),
+            _B(attribute_1='test', a=a_list[-1]),
         ]
-        for i in range(1, len(b_list)):
-            self.assertTrue(b_list[0].is_subset(b_list[i]))
-        for i in range(len(b_list) - 1):
-            print(i)
-            self.assertFalse(b_list[-1].is_subset(b_list[i]))
+        n_b = len(b_list)
+        for i in range(1, n_b):
+            with self.subTest(i=i):
+                self.assertTrue(b_list[0].is_subset(b_list[i]))
+        for i in range(n_b - 1):
+            with self.subTest(i=i):
+                self.assertFalse(b_list[-1].is_subset(b_list[i]))
         self.assertTrue(b_list[-1].is_subset(b_list[-1]))
         self.assertFalse(b_list[5].is_subset(b_list[4]))
         self.assertTrue(b_list[4].is_subset(b_list[5]))
@@ -186,5 +186,26 @@ class TestModel(unittest.TestCase):
         self.assertFalse(b_list[2].is_subset(b_list[0]))
 
 
+class TestModelUpdate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        elements = [Sentence('Here we define the Néel temperature, TN')]
+        definitions = elements[0].definitions
+        NeelTemperature.update(definitions)
+        cls.tagged_tokens = Sentence('TN = 300 K').tagged_tokens
+
+    @classmethod
+    def tearDownClass(cls):
+        NeelTemperature.reset_updatables()
+
+    def test_model_update_definitions(self):
+        """Test that the model parse expressions update method.
+        """
+        results = [i for i in NeelTemperature.parsers[0].parse_sentence(self.tagged_tokens)][0].serialize()
+
+        self.assertEqual(results, {'NeelTemperature': {'raw_value': '300', 'raw_units': 'K', 'value': [300.0], 'units': 'Kelvin^(1.0)', 'specifier': 'TN'}})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,6 +13,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import logging
+import os
 import unittest
 
 from chemdataextractor.model.pv_model import ShortCircuitCurrentDensity, OpenCircuitVoltage, FillFactor,\
@@ -28,12 +29,21 @@ from chemdataextractor.doc.table import Table
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
 
+#: Set CDE_FAST=1 to skip the sentence and paragraph tests, which run the full tagging pipeline
+FAST = os.environ.get('CDE_FAST') == '1'
 
-class TestPhotovoltaicCellModelTable(unittest.TestCase):
+
+def setUpModule():
+    # Load the tokenizer and taggers once, so their start-up cost is not charged to the first test
+    Sentence('Warm up').tagged_tokens
+
+
+class _RecordsTestCase(unittest.TestCase):
+    """Base class for the PV model tests, which compare lists of serialised records."""
+
+    maxDiff = None
 
     def do_table_cell(self, cell_list, expected, model):
-        self.maxDiff = None
-        logging.basicConfig(level=logging.DEBUG)
         table = Table(caption=Caption(""),
                       table_data=cell_list,
                       models=[model])
@@ -42,6 +52,9 @@ class TestPhotovoltaicCellModelTable(unittest.TestCase):
             output.append(record.serialize())
         self.assertCountEqual(output, expected)
 
+
+class TestPhotovoltaicCellModelTable(_RecordsTestCase):
+
     def test_adsorbed_dye_not_identified_table(self):
         """ Check that cases containing the units for dye loading in the heading are ignored."""
         input = [['Dye', 'Adsorbed dye (10−7 mol cm−2)'], ['N719', '2.601']]
@@ -350,8 +363,6 @@ class TestPhotovoltaicCellModelTable(unittest.TestCase):
 
     def test_specific_charge_transfer_extracted_when_appropriate_in_pv_cell(self):
         input = [['Dye', 'Rct (Ω cm2)'], ['N719', '3.61']]
-        self.maxDiff = None
-        logging.basicConfig(level=logging.DEBUG)
         table = Table(caption=Caption(""),
                       table_data=input,
                       models=[PhotovoltaicCell])
@@ -366,8 +377,6 @@ class TestPhotovoltaicCellModelTable(unittest.TestCase):
 
     def test_specific_charge_transfer_not_extracted_when_appropriate_in_pv_cell(self):
         input = [['Dye', 'Rct (Ω)'], ['N719', '5.28']]
-        self.maxDiff = None
-        logging.basicConfig(level=logging.DEBUG)
         table = Table(caption=Caption(""),
                       table_data=input,
                       models=[PhotovoltaicCell])
@@ -420,7 +429,8 @@ class TestPhotovoltaicCellModelTable(unittest.TestCase):
         self.do_table_cell(input, expected, PowerMax)
 
 
-class TestPhotovoltaicCellText(unittest.TestCase):
+@unittest.skipIf(FAST, 'CDE_FAST set')
+class TestPhotovoltaicCellText(_RecordsTestCase):
     """ Tests to check that the PV parsers work on sentences when required.
         This is geared towards properties that are likely to be contextual.
     """
@@ -595,18 +605,7 @@ class TestPhotovoltaicCellText(unittest.TestCase):
         self.do_sentence(input, expected, RedoxCouple)
 
 
-class TestPerovskiteCellTable(unittest.TestCase):
-
-    def do_table_cell(self, cell_list, expected, model):
-        self.maxDiff = None
-        logging.basicConfig(level=logging.DEBUG)
-        table = Table(caption=Caption(""),
-                      table_data=cell_list,
-                      models=[model])
-        output = []
-        for record in table.records:
-            output.append(record.serialize())
-        self.assertCountEqual(output, expected)
+class TestPerovskiteCellTable(_RecordsTestCase):
 
     # Tests for the specfic property extraction
     def test_simple_perovskite_sc_table(self):
@@ -750,7 +749,8 @@ class TestPerovskiteCellTable(unittest.TestCase):
         self.do_table_cell(input, expected, ElectronTransportLayer)
 
 
-class TestPerovskiteCellSentence(unittest.TestCase):
+@unittest.skipIf(FAST, 'CDE_FAST set')
+class TestPerovskiteCellSentence(_RecordsTestCase):
 
     def do_sentence(self, input, expected, model):
         sentence = Sentence(input)
@@ -758,7 +758,7 @@ class TestPerovskiteCellSentence(unittest.TestCase):
         output = []
         for record in sentence.records:
             output.append(record.serialize())
-        self.assertEqual(expected, output)
+        self.assertEqual(output, expected)
 
     def test_hole_transport_layer_sentence_1(self):
         text = 'A HTM of spiro-OMeTAD was used.'
@@ -840,260 +840,132 @@ class TestPerovskiteCellSentence(unittest.TestCase):
         {'CounterElectrode': {'raw_value': 'Au', 'specifier': 'electrodes'}}]
         sentence = Sentence(text)
         sentence.models = [ActiveArea, CounterElectrode]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
+        output = [record.serialize() for record in sentence.records]
         self.assertEqual(output, expected)
 
     def test_counter_electrode_slash_format(self):
         text = 'ITO/PEDOT:PSS/CH3NH3PbI3−xClx/EEL/Al'
         expected = [{'CounterElectrode': {'raw_value': 'Al', 'specifier': 'ITO'}}]
-        sentence = Sentence(text)
-        sentence.models = [CounterElectrode]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, CounterElectrode)
 
     def test_counter_electrode_slash_format_2(self):
 
         text = 'Herein, we demonstrated a low temperature solution process to obtain high quality CsPbI2Br films and fabricate devices with a facile n-i-p structure (ITO/SnO2/CsPbI2Br/Spiro-OMeTAD/MoO3/Ag), in which MoO3 was introduced as interfacial layer that led to high efficient charge extraction and suppressed carrier recombination.'
         expected = [{'CounterElectrode': {'raw_value': 'Ag', 'specifier': 'ITO'}}]
-        sentence = Sentence(text)
-        sentence.models = [CounterElectrode]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, CounterElectrode)
 
 
     def test_substrate_parser_1(self):
         text = 'ITO/PEDOT:PSS/CH3NH3PbI3−xClx/EEL/Al'
         expected = [{'Substrate': {'raw_value': 'ITO', 'specifier': '/'}}]
-        sentence = Sentence(text)
-        sentence.models = [Substrate]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, Substrate)
 
     def test_perovskite_sentence_parser_1(self):
 
         text = 'perovskite found of CsPbCl3'
         expected = [{'SentencePerovskite': {'raw_value': 'CsPbCl3', 'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_2(self):
 
         # TEsting case where the formula contains an abbreviation that isn't an element
         text = 'perovskite found of MAPbI3'
         expected = [{'SentencePerovskite': {'raw_value': 'MAPbI3', 'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_3(self):
 
         # testing case where the perovskite contains a variable
         text = 'perovskite found of CH3NH3PbI3-xBrx'
         expected = [{'SentencePerovskite': {'raw_value': 'CH3NH3PbI3-xBrx', 'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_4(self):
 
         # testing case where the perovskite contains a variable
         text = 'light harvester was determined to be (H3NC6H12NH3)BiI5'
         expected = [{'SentencePerovskite': {'raw_value': '(H3NC6H12NH3)BiI5', 'specifier': 'light harvester'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_5(self):
         # testing case where the perovskite contains a variable
         text = 'Light harvester was determined to use the compound MASn0.1Pb0.9I3.'
         expected = [{'SentencePerovskite': {'raw_value': 'MASn0.1Pb0.9I3', 'specifier': 'Light harvester'}}]
-        sentence = Sentence(text )
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_6(self):
         # testing case where the perovskite contains a variable
         text = 'Light harvester was determined to use MASn0.1Pb0.9I3.'
         expected = [{'SentencePerovskite': {'raw_value': 'MASn0.1Pb0.9I3', 'specifier': 'Light harvester'}}]
-        sentence = Sentence(text )
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_7(self):
 
         text = 'All-inorganic perovskite CsPbI2Br has received much attention recently due to its suitable bandgap and excellent thermal stability.'
         expected = [{'SentencePerovskite': {'raw_value': 'CsPbI2Br', 'specifier': 'perovskite'}}]
-        sentence = Sentence(text )
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
-
-    def test_perovskite_sentence_parser_8(self):
-
-        text = 'All-inorganic perovskite CsPbI2Br has received much attention recently due to its suitable bandgap and excellent thermal stability.'
-        expected = [{'SentencePerovskite': {'raw_value': 'CsPbI2Br', 'specifier': 'perovskite'}}]
-        sentence = Sentence(text )
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_9(self):
         text = 'ITO/PEDOT:PSS/CH3NH3PbI3−xClx/EEL/Al'
         expected = [{'SentencePerovskite': {'raw_value': 'CH3NH3PbI3−xClx', 'specifier': 'ITO /'}}]
-        sentence = Sentence(text )
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_10(self):
         text = 'In Fig. S5, we show a cross-sectional SEM image of the samples with the structure of glass/FTO/m-TiO2/MAPbI3/spiro-OMeTAD. '
         expected = [{'SentencePerovskite': {'raw_value': 'MAPbI3', 'specifier': 'glass /'}}]
-        sentence = Sentence(text )
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_PbI2(self):
         text = 'The perovskite was synthesized using the precursor PbI2 material.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_precursor_material(self):
         text = 'The perovskite was synthesized using the precursor PbCl2 material.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_precursor_material_2(self):
         text = 'The perovskite was synthesized using the precursor PbBr2 material.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_precursor_material_3(self):
         text = 'The perovskite was synthesized using the precursor Bi2S3 material.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_precursor_material_4(self):
         text = 'The perovskite was synthesized using the precursor Sb2S3 material.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_allowed_material(self):
         text = 'The perovskite was synthesized using the precursor CsSnI3 material.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite', 'raw_value': 'CsSnI3'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_string_that_doesnt_contain_digit(self):
         text = 'The perovskite was found with the GeneRAlly material.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_word_containing_element(self):
         text = 'Snapshot of shear-deposited perovskite film on NiOX/ITO/Glass substrate.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_word_containing_element_2(self):
         text = 'Bilayer of shear-deposited perovskite film on NiOX/ITO/Glass substrate.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_semiconductor(self):
         text = 'For CuRPc spin coated on the perovskite, the speed of this decomposition was restrained as confirmed by our UV–Vis absorption spectra, XRD measurements, and photographs of the FTO/SnO2/perovskite/CuRPc.'
         expected = [{'SentencePerovskite': {'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
 
     def test_perovskite_sentence_parser_disallowed_semiconductor_with_perovskite_after(self):
         text = 'We got the perovskite placed on top of SnO2, and the material was CH3NH3PbI3.'
         expected = [{'SentencePerovskite': {'raw_value': 'CH3NH3PbI3', 'specifier': 'perovskite'}}]
-        sentence = Sentence(text)
-        sentence.models = [SentencePerovskite]
-        output = []
-        for record in sentence.records:
-            output.append(record.serialize())
-        self.assertEqual(output, expected)
+        self.do_sentence(text, expected, SentencePerovskite)
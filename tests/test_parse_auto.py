@@ -31,7 +31,7 @@ from chemdataextractor.model.units.length import Meter, Mile, Length, LengthMode
 from chemdataextractor.model.units.temperature import Temperature, TemperatureModel, Kelvin, Celsius, Fahrenheit
 from chemdataextractor.model.units.mass import Mass, Gram
 from chemdataextractor.model.units.energy import Energy
-from chemdataextractor.parse.auto import construct_unit_element, match_dimensions_of, AutoSentenceParser
+from chemdataextractor.parse.auto import construct_unit_element, match_dimensions_of, AutoSentenceParser, AutoTableParserOptionalCompound
 from chemdataextractor.parse.quantity import value_element_plain
 from chemdataextractor.doc.text import Sentence
 from chemdataextractor.parse.elements import I
@@ -40,6 +40,7 @@ from chemdataextractor.model.units.current_density import CurrentDensityModel, C
 from chemdataextractor.doc.table import Table, Cell
 from chemdataextractor.doc.text import Caption
 from chemdataextractor.model.pv_model import OpenCircuitVoltage
+from chemdataextractor.utils import memoize
 
 from lxml import etree
 
@@ -74,99 +75,96 @@ class AreaPerTimeModel(QuantityModel):
     dimensions = AreaPerTime()
 
 
+@memoize
+def _units_expression(dimensions, model):
+    """Units element for the dimensions, built once for each (dimensions, model) pair used by the tests."""
+    return construct_unit_element(dimensions).with_condition(match_dimensions_of(model))('raw_units')
+
+
 class TestAutoRules(unittest.TestCase):
 
+    def do_scan(self, expression, tagged_tokens, expected):
+        results_list = [etree.tostring(result[0]) for result in expression.scan(tagged_tokens)]
+        self.assertEqual(expected, results_list)
+
+    def test_root_is_reused_until_fields_change(self):
+        parser = SpeedModel.parsers[0]
+        root = parser.root
+        self.assertIs(root, parser.root)
+        specifier_field = SpeedModel.fields['specifier']
+        specifier_expression = specifier_field.parse_expression
+        specifier_field.parse_expression = specifier_expression | I('velocity')
+        try:
+            self.assertIsNot(root, parser.root)
+        finally:
+            specifier_field.parse_expression = specifier_expression
+
+    def test_dimensions_condition_after_cached_match(self):
+        check_match = match_dimensions_of(SpeedModel)
+        matching = etree.Element('raw_units')
+        matching.text = 'm/s'
+        not_matching = etree.Element('raw_units')
+        not_matching.text = 'K'
+        self.assertTrue(check_match((matching, 0)))
+        self.assertTrue(check_match((matching, 0)))
+        self.assertFalse(check_match((not_matching, 0)))
+        self.assertTrue(check_match((matching, 0)))
+
     def test_unit_element(self):
         test_sentence = Sentence('The speed was 31 m/s and')
-        units_expression = construct_unit_element(Speed()).with_condition(match_dimensions_of(SpeedModel))('raw_units')
-        results = units_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
+        units_expression = _units_expression(Speed(), SpeedModel)
         expected = [b'<raw_units>m/s</raw_units>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(units_expression, test_sentence.tagged_tokens, expected)
 
     def test_unit_element_2(self):
         test_sentence = Sentence('The specific heat was 16 J/(kgK) which was')
-        units_expression = construct_unit_element(SpecificHeat()).with_condition(match_dimensions_of(SpecificHeatModel()))('raw_units')
-        results = units_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
+        units_expression = _units_expression(SpecificHeat(), SpecificHeatModel)
         expected = [b'<raw_units>J/(kgK)</raw_units>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(units_expression, test_sentence.tagged_tokens, expected)
 
     def test_unit_element_3(self):
         test_sentence = Sentence('The specific heat was 16 J/kg-K which was')
         print(test_sentence.tagged_tokens)
-        units_expression = construct_unit_element(SpecificHeat()).with_condition(match_dimensions_of(SpecificHeatModel()))('raw_units')
-        results = units_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
+        units_expression = _units_expression(SpecificHeat(), SpecificHeatModel)
         expected = [b'<raw_units>J/kg-K</raw_units>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(units_expression, test_sentence.tagged_tokens, expected)
 
     def test_unit_element_4(self):
         test_celllike_sentence = Cell('7.53 sdfkljlk N719 sdfkljlk Jsc mAcm–2')
         print(test_celllike_sentence.tagged_tokens)
-        units_expression = construct_unit_element(CurrentDensity()).with_condition(match_dimensions_of(CurrentDensityModel()))('raw_units')
-        results = units_expression.scan(test_celllike_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
+        units_expression = _units_expression(CurrentDensity(), CurrentDensityModel)
         expected = [b'<raw_units>mAcm&#8211;2</raw_units>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(units_expression, test_celllike_sentence.tagged_tokens, expected)
 
     def test_unit_element_nospace(self):
         test_sentence = Sentence('Area was increasing at 31 m2/s and')
-        units_expression = construct_unit_element(AreaPerTime()).with_condition(match_dimensions_of(AreaPerTimeModel))('raw_units')
-        results = units_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
+        units_expression = _units_expression(AreaPerTime(), AreaPerTimeModel)
         expected = [b'<raw_units>m2/s</raw_units>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(units_expression, test_sentence.tagged_tokens, expected)
 
     def test_value_element(self):
         test_sentence = Sentence('The value was 123.8')
         value_expression = value_element_plain()
-        results = value_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
         expected = [b'<raw_value>123.8</raw_value>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(value_expression, test_sentence.tagged_tokens, expected)
 
     def test_value_element_comma(self):
         test_sentence = Sentence('The value was 3,123.8')
         value_expression = value_element_plain()
-        results = value_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
         expected = [b'<raw_value>3,123.8</raw_value>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(value_expression, test_sentence.tagged_tokens, expected)
 
     def test_value_element_european(self):
         test_sentence = Sentence('The value was 123,8')
         value_expression = value_element_plain()
-        results = value_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
         expected = [b'<raw_value>123,8</raw_value>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(value_expression, test_sentence.tagged_tokens, expected)
 
     def test_value_element_brackets(self):
         test_sentence = Sentence('The value was 123(8)')
         value_expression = value_element_plain()
-        results = value_expression.scan(test_sentence.tagged_tokens)
-        results_list = []
-        for result in results:
-            results_list.append(etree.tostring(result[0]))
         expected = [b'<raw_value>123(8)</raw_value>']
-        self.assertEqual(expected, results_list)
+        self.do_scan(value_expression, test_sentence.tagged_tokens, expected)
 
 
 class TestAutoSentenceParser(unittest.TestCase):
@@ -184,8 +182,12 @@ class TestAutoSentenceParser(unittest.TestCase):
 
 class TestAutoTableParserOptionalCompound(unittest.TestCase):
 
+    def test_root_is_reused(self):
+        parser = AutoTableParserOptionalCompound()
+        parser.model = OpenCircuitVoltage
+        self.assertIs(parser.root, parser.root)
+
     def do_table_cell(self, cell_list, expected, model):
-        logging.basicConfig(level=logging.DEBUG)
         table = Table(caption=Caption(""),
                       table_data=cell_list,
                       models=[model])